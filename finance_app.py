@@ -20,21 +20,64 @@ import sqlite3
 from decimal import Decimal, InvalidOperation, getcontext
 from datetime import date, datetime, timedelta
 import os
-import shutil
+from pathlib import Path
+import queue
+import threading
 import csv
+import string
+from functools import lru_cache
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog, simpledialog
 
 # --- Config ---
 DB_FILE = "finance.db"
 BACKUP_DIR = "backups"
+TREE_BATCH = 100  # rows inserted into the Treeview per idle callback
 getcontext().prec = 28  # Decimal precision
+ZERO = Decimal(0)
+HUNDRED = Decimal(100)
+TWOPLACES = Decimal("0.01")  # quantizer for 2-decimal currency display
+# per-amount cap (~10^11 currency units), far enough below 2^63 that SUM() over any
+# realistic number of rows cannot overflow SQLite's INTEGER
+MAX_AMOUNT_CENTS = 10**13
+# SQLite's LIKE only folds ASCII case; this table does the same in Python
+ASCII_LOWER = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
 
 
 # --- Database Helpers ---
+_conn: sqlite3.Connection | None = None
+
+
+def get_connection() -> sqlite3.Connection:
+    # One shared connection for the lifetime of the app; reopening per call
+    # throws away SQLite's page cache every time.
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(DB_FILE, check_same_thread=False)
+        _conn.row_factory = sqlite3.Row
+        # WAL lets readers run alongside a writer; NORMAL skips the per-commit fsync of the WAL
+        _conn.execute("PRAGMA journal_mode=WAL")
+        _conn.execute("PRAGMA synchronous=NORMAL")
+        _conn.execute("PRAGMA temp_store=MEMORY")
+        _conn.execute("PRAGMA cache_size=-20000")  # ~20 MB page cache
+        _conn.execute("PRAGMA mmap_size=268435456")  # 256 MB
+    return _conn
+
+
+def connect_readonly() -> sqlite3.Connection:
+    # for the export thread: under WAL it reads a consistent snapshot; caller closes it
+    return sqlite3.connect(Path(DB_FILE).resolve().as_uri() + "?mode=ro", uri=True)
+
+
+def get_tuple_cursor(conn: sqlite3.Connection | None = None) -> sqlite3.Cursor:
+    # plain-tuple rows for per-row hot loops
+    cur = (conn or get_connection()).cursor()
+    cur.row_factory = None
+    return cur
+
+
 def init_db() -> None:
-    conn = sqlite3.connect(DB_FILE)
-    conn.row_factory = sqlite3.Row
+    conn = get_connection()
     c = conn.cursor()
     c.execute(
         """
@@ -62,11 +105,28 @@ def init_db() -> None:
             type TEXT NOT NULL,
             category TEXT NOT NULL,
             amount TEXT NOT NULL,
+            amount_cents INTEGER NOT NULL,
             notes TEXT,
             goal_id INTEGER
         )
         """
     )
+    # Migrate databases created before amounts were stored as integer cents. The column is
+    # added nullable and user_version is only bumped in the same transaction as the
+    # backfill, so an interrupted migration is retried on the next start.
+    if c.execute("PRAGMA user_version").fetchone()[0] < 1:
+        cols = {r["name"] for r in c.execute("PRAGMA table_info(transactions)")}
+        if "amount_cents" not in cols:
+            c.execute("ALTER TABLE transactions ADD COLUMN amount_cents INTEGER")
+            conn.commit()
+        pending = c.execute("SELECT id, amount FROM transactions WHERE amount_cents IS NULL").fetchall()
+        with conn:
+            conn.executemany("UPDATE transactions SET amount_cents = ? WHERE id = ?", [(legacy_cents(r["amount"]), r["id"]) for r in pending])
+            conn.execute("PRAGMA user_version = 1")
+    # date range filters (fetch_transactions, sum_month) scan the (date, category) prefix
+    c.execute("CREATE INDEX IF NOT EXISTS idx_tx_date_cat ON transactions(date, category)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_tx_goal ON transactions(goal_id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_tx_cat ON transactions(category)")
     conn.commit()
 
     # Seed default categories if empty
@@ -84,82 +144,122 @@ def init_db() -> None:
             "Savings",
             "Miscellaneous",
         ]
-        c.executemany("INSERT INTO categories (name) VALUES (?)", [(x,) for x in default_cats])
-        conn.commit()
-
-    conn.close()
+        with conn:
+            conn.executemany("INSERT INTO categories (name) VALUES (?)", [(x,) for x in default_cats])
+        invalidate_categories()
 
 
-def get_connection():
-    conn = sqlite3.connect(DB_FILE)
-    conn.row_factory = sqlite3.Row
-    return conn
+@lru_cache(maxsize=1)
+def _get_categories_cached() -> tuple[str, ...]:
+    conn = get_connection()
+    rows = conn.execute("SELECT name FROM categories ORDER BY name").fetchall()
+    return tuple(r["name"] for r in rows)
 
 
 def get_categories() -> list[str]:
-    conn = get_connection()
-    rows = conn.execute("SELECT name FROM categories ORDER BY name").fetchall()
-    conn.close()
-    return [r["name"] for r in rows]
+    # categories only change at seed time; call invalidate_categories() after adding one
+    return list(_get_categories_cached())
+
+
+def invalidate_categories() -> None:
+    _get_categories_cached.cache_clear()
 
 
 def get_goals() -> list[dict]:
-    conn = get_connection()
-    rows = conn.execute("SELECT * FROM goals ORDER BY id").fetchall()
-    goals = []
-    for r in rows:
-        gid = r["id"]
-        target = Decimal(r["target_amount"])
-        row_sum = conn.execute("SELECT amount FROM transactions WHERE goal_id = ?", (gid,)).fetchall()
-        total = sum(Decimal(x["amount"]) for x in row_sum) if row_sum else Decimal(0)
-        goals.append({"id": gid, "name": r["name"], "target": target, "deadline": r["deadline"], "progress": total})
-    conn.close()
-    return goals
+    rows = get_tuple_cursor().execute(
+        """
+        SELECT g.id, g.name, g.target_amount, g.deadline,
+               COALESCE(SUM(t.amount_cents), 0) AS progress_cents
+        FROM goals g
+        LEFT JOIN transactions t ON t.goal_id = g.id
+        GROUP BY g.id
+        ORDER BY g.id
+        """
+    ).fetchall()
+    return [
+        {"id": gid, "name": name, "target": Decimal(target), "deadline": deadline, "progress_cents": progress_cents}
+        for gid, name, target, deadline, progress_cents in rows
+    ]
 
 
 def add_goal(name: str, target_amount: Decimal, deadline: str | None) -> None:
     conn = get_connection()
-    conn.execute("INSERT INTO goals (name, target_amount, deadline) VALUES (?,?,?)", (name, str(target_amount), deadline))
+    conn.execute("INSERT INTO goals (name, target_amount, deadline) VALUES (?,?,?)", (name, str(target_amount.quantize(TWOPLACES)), deadline))
     conn.commit()
-    conn.close()
 
 
-def add_transaction(date_str: str, ttype: str, category: str, amount: Decimal, notes: str, goal_id: int | None) -> None:
+INSERT_TX_SQL = "INSERT INTO transactions (date,type,category,amount,amount_cents,notes,goal_id) VALUES (?,?,?,?,?,?,?)"
+
+
+def add_transactions_bulk(rows) -> None:
+    # rows are (date, type, category, amount, notes, goal_id) tuples
     conn = get_connection()
-    conn.execute(
-        "INSERT INTO transactions (date,type,category,amount,notes,goal_id) VALUES (?,?,?,?,?,?)",
-        (date_str, ttype, category, str(amount), notes, goal_id),
-    )
-    conn.commit()
-    conn.close()
+    with conn:
+        conn.executemany(INSERT_TX_SQL, ((d, t, cat, *amount_columns(amt), notes, gid) for d, t, cat, amt, notes, gid in rows))
+
+
+def add_transaction(date_str: str, ttype: str, category: str, amount: Decimal, notes: str, goal_name: str | None) -> int:
+    conn = get_connection()
+    with conn:
+        cur = conn.execute(
+            "INSERT INTO transactions (date,type,category,amount,amount_cents,notes,goal_id) "
+            "VALUES (?,?,?,?,?,?,(SELECT id FROM goals WHERE name = ?))",
+            (date_str, ttype, category, *amount_columns(amount), notes, goal_name),
+        )
+    return cur.lastrowid
 
 
 def delete_transaction(tx_id: int) -> None:
     conn = get_connection()
     conn.execute("DELETE FROM transactions WHERE id=?", (tx_id,))
     conn.commit()
-    conn.close()
 
 
-def fetch_transactions(date_from: str | None = None, date_to: str | None = None, category: str | None = None, search: str | None = None, limit: int = 2000):
-    conn = get_connection()
-    q = "SELECT t.*, g.name as goal_name FROM transactions t LEFT JOIN goals g ON t.goal_id = g.id WHERE 1=1"
+# One prebuilt statement per combination of active filters, keyed by bitmask, so the
+# SQL text is always one of 16 fixed strings and sqlite3's statement cache always hits
+_FETCH_TX_FILTERS = (
+    "t.date >= ?",
+    "t.date <= ?",
+    "t.category = ?",
+    "(t.notes LIKE ? ESCAPE '\\' OR t.category LIKE ? ESCAPE '\\')",
+)
+
+
+def _build_fetch_tx_sql(mask: int) -> str:
+    where = [clause for bit, clause in enumerate(_FETCH_TX_FILTERS) if mask & (1 << bit)]
+    q = (
+        "SELECT t.id, t.date, t.type, t.category, t.amount, t.amount_cents, t.notes, g.name"
+        " FROM transactions t LEFT JOIN goals g ON t.goal_id = g.id"
+    )
+    if where:
+        q += " WHERE " + " AND ".join(where)
+    return q + " ORDER BY t.date DESC, t.id DESC LIMIT ?"
+
+
+FETCH_TX_SQL = {mask: _build_fetch_tx_sql(mask) for mask in range(1 << len(_FETCH_TX_FILTERS))}
+
+
+def fetch_transactions(date_from: str | None = None, date_to: str | None = None, category: str | None = None, search: str | None = None, limit: int = 2000, conn: sqlite3.Connection | None = None):
+    # yields (id, date, type, category, amount, amount_cents, notes, goal_name), newest first
+    mask = 0
     params = []
     if date_from:
-        q += " AND date >= ?"; params.append(date_from)
+        mask |= 1; params.append(date_from)
     if date_to:
-        q += " AND date <= ?"; params.append(date_to)
+        mask |= 2; params.append(date_to)
     if category and category != "All":
-        q += " AND category = ?"; params.append(category)
+        mask |= 4; params.append(category)
     if search:
-        q += " AND (notes LIKE ? OR category LIKE ?)"; params.extend([f"%{search}%", f"%{search}%"])
-    q += " ORDER BY date DESC, id DESC LIMIT ?"; params.append(limit)
-    rows = conn.execute(q, params).fetchall()
-    conn.close()
-    return rows
+        # escape LIKE wildcards so search is a literal substring match
+        pattern = "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        mask |= 8; params.extend([pattern, pattern])
+    params.append(limit)
+    # yield rows as SQLite produces them instead of materializing the full result
+    yield from get_tuple_cursor(conn).execute(FETCH_TX_SQL[mask], params)
 
 
-def sum_month(month_year: str | None = None) -> tuple[Decimal, Decimal]:
+def sum_month(month_year: str | None = None) -> tuple[int, int]:
+    # returns (income, expense) in cents
     if not month_year:
         month_year = date.today().strftime("%Y-%m")
     y, m = map(int, month_year.split("-"))
@@ -169,20 +269,56 @@ def sum_month(month_year: str | None = None) -> tuple[Decimal, Decimal]:
     else:
         next_month = date(y, m + 1, 1)
     end = next_month - timedelta(days=1)
-    conn = get_connection()
-    rows = conn.execute("SELECT type, amount FROM transactions WHERE date BETWEEN ? AND ?", (start.isoformat(), end.isoformat())).fetchall()
-    income = Decimal(0); expense = Decimal(0)
-    for r in rows:
-        amt = Decimal(r["amount"])
-        if r["type"] == "Income":
-            income += amt
+    rows = get_tuple_cursor().execute(
+        "SELECT type, SUM(amount_cents) AS total FROM transactions WHERE date BETWEEN ? AND ? GROUP BY type",
+        (start.isoformat(), end.isoformat()),
+    ).fetchall()
+    income = 0; expense = 0
+    for ttype, total in rows:
+        if ttype == "Income":
+            income += total
         else:
-            expense += amt
-    conn.close()
+            expense += total
     return income, expense
 
 
 # --- Utility helpers ---
+def to_cents(amount: Decimal) -> int:
+    return int((amount * HUNDRED).to_integral_value())
+
+
+def amount_columns(amount: Decimal) -> tuple[str, int]:
+    # quantize first so the amount and amount_cents columns always agree
+    amount = amount.quantize(TWOPLACES)
+    return str(amount), to_cents(amount)
+
+
+def is_valid_amount(amount: Decimal) -> bool:
+    return (
+        amount.is_finite()
+        and amount > ZERO
+        and amount * HUNDRED <= MAX_AMOUNT_CENTS
+        and amount == amount.quantize(TWOPLACES)
+    )
+
+
+def legacy_cents(amount: str) -> int:
+    # legacy amounts that can't be stored as cents count as 0; the amount column keeps the text
+    try:
+        dec = Decimal(amount)
+        if dec.is_finite() and abs(dec * HUNDRED) <= MAX_AMOUNT_CENTS:
+            return to_cents(dec)
+    except InvalidOperation:
+        pass
+    return 0
+
+
+def format_cents(cents: int) -> str:
+    sign = "-" if cents < 0 else ""
+    whole, frac = divmod(abs(cents), 100)
+    return f"{sign}{whole}.{frac:02d}"
+
+
 def ensure_backup_dir():
     os.makedirs(BACKUP_DIR, exist_ok=True)
 
@@ -191,18 +327,23 @@ def backup_db():
     ensure_backup_dir()
     ts = datetime.now().strftime("%Y%m%d_%H%M%S")
     dest = os.path.join(BACKUP_DIR, f"finance_backup_{ts}.db")
-    shutil.copy(DB_FILE, dest)
+    # SQLite's online backup copies a consistent snapshot, including pages still in the WAL
+    dst = sqlite3.connect(dest)
+    try:
+        get_connection().backup(dst)
+    finally:
+        dst.close()
     return dest
 
 
 def export_transactions_csv(rows, filename=None):
     if not filename:
         filename = f"transactions_export_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-    with open(filename, "w", newline="", encoding="utf-8") as f:
+    # csv writes None as an empty field, so rows can be passed straight through
+    with open(filename, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
         w = csv.writer(f)
         w.writerow(["id", "date", "type", "category", "amount", "notes", "goal_name"])
-        for r in rows:
-            w.writerow([r["id"], r["date"], r["type"], r["category"], r["amount"], r["notes"], r["goal_name"]])
+        w.writerows((tx_id, d, ttype, cat, amt, notes, goal_name) for tx_id, d, ttype, cat, amt, _cents, notes, goal_name in rows)
     return filename
 
 
@@ -212,6 +353,11 @@ class FinanceApp:
         self.root = root
         self.root.title("Personal Finance Tracker (Offline)")
         self.root.geometry("1000x600")
+        self._tree_gen = 0  # bumped on every refresh so stale deferred inserts are dropped
+        self._shown_ids: set[int] = set()
+        self._tree_filter = (None, None, None, None)  # filters the tree was last loaded with
+        self._export_thread: threading.Thread | None = None
+        self._fields: dict[str, str] = {}  # stripped form values, kept current by _track
 
         # top-level frames
         self.left_frame = ttk.Frame(root, padding=(10,10))
@@ -230,6 +376,14 @@ class FinanceApp:
         self.refresh_transactions()
         self.update_month_summary()
 
+    def _track(self, key, var):
+        # mirror var's stripped value into self._fields on every write
+        def update(*_):
+            self._fields[key] = var.get().strip()
+        var.trace_add("write", update)
+        update()
+        return var
+
     # Left: Add Transaction + Goals
     def _build_left(self):
         # Add Transaction Card
@@ -238,34 +392,34 @@ class FinanceApp:
 
         # Date
         ttk.Label(card, text="Date (YYYY-MM-DD)").grid(row=0, column=0, sticky=tk.W)
-        self.date_var = tk.StringVar(value=date.today().isoformat())
+        self.date_var = self._track("date", tk.StringVar(value=date.today().isoformat()))
         ttk.Entry(card, textvariable=self.date_var).grid(row=0, column=1, sticky=tk.EW, padx=5, pady=2)
 
         # Type
         ttk.Label(card, text="Type").grid(row=1, column=0, sticky=tk.W)
-        self.type_var = tk.StringVar(value="Expense")
+        self.type_var = self._track("type", tk.StringVar(value="Expense"))
         ttk.Combobox(card, textvariable=self.type_var, values=["Expense","Income"], state="readonly").grid(row=1, column=1, sticky=tk.EW, padx=5, pady=2)
 
         # Category
         ttk.Label(card, text="Category").grid(row=2, column=0, sticky=tk.W)
-        self.cat_var = tk.StringVar()
+        self.cat_var = self._track("category", tk.StringVar())
         self.cat_cb = ttk.Combobox(card, textvariable=self.cat_var, values=[], state="readonly")
         self.cat_cb.grid(row=2, column=1, sticky=tk.EW, padx=5, pady=2)
 
         # Amount
         ttk.Label(card, text="Amount").grid(row=3, column=0, sticky=tk.W)
-        self.amt_var = tk.StringVar()
+        self.amt_var = self._track("amount", tk.StringVar())
         ttk.Entry(card, textvariable=self.amt_var).grid(row=3, column=1, sticky=tk.EW, padx=5, pady=2)
 
         # Goal (optional)
         ttk.Label(card, text="Apply to Goal (optional)").grid(row=4, column=0, sticky=tk.W)
-        self.goal_var = tk.StringVar()
+        self.goal_var = self._track("goal", tk.StringVar())
         self.goal_cb = ttk.Combobox(card, textvariable=self.goal_var, values=[], state="readonly")
         self.goal_cb.grid(row=4, column=1, sticky=tk.EW, padx=5, pady=2)
 
         # Notes
         ttk.Label(card, text="Notes").grid(row=5, column=0, sticky=tk.W)
-        self.notes_var = tk.StringVar()
+        self.notes_var = self._track("notes", tk.StringVar())
         ttk.Entry(card, textvariable=self.notes_var).grid(row=5, column=1, sticky=tk.EW, padx=5, pady=2)
 
         # Buttons
@@ -292,20 +446,20 @@ class FinanceApp:
         filter_frame.pack(fill=tk.X, pady=(0,10))
 
         ttk.Label(filter_frame, text="From").pack(side=tk.LEFT)
-        self.filter_from = tk.StringVar(value=(date.today().replace(day=1).isoformat()))
+        self.filter_from = self._track("filter_from", tk.StringVar(value=(date.today().replace(day=1).isoformat())))
         ttk.Entry(filter_frame, width=12, textvariable=self.filter_from).pack(side=tk.LEFT, padx=5)
 
         ttk.Label(filter_frame, text="To").pack(side=tk.LEFT)
-        self.filter_to = tk.StringVar(value=date.today().isoformat())
+        self.filter_to = self._track("filter_to", tk.StringVar(value=date.today().isoformat()))
         ttk.Entry(filter_frame, width=12, textvariable=self.filter_to).pack(side=tk.LEFT, padx=5)
 
         ttk.Label(filter_frame, text="Category").pack(side=tk.LEFT, padx=(10,0))
-        self.filter_cat = tk.StringVar(value="All")
+        self.filter_cat = self._track("filter_cat", tk.StringVar(value="All"))
         self.filter_cat_cb = ttk.Combobox(filter_frame, textvariable=self.filter_cat, values=["All"], state="readonly", width=20)
         self.filter_cat_cb.pack(side=tk.LEFT, padx=5)
 
         ttk.Label(filter_frame, text="Search").pack(side=tk.LEFT, padx=(10,0))
-        self.search_var = tk.StringVar()
+        self.search_var = self._track("search", tk.StringVar())
         ttk.Entry(filter_frame, width=20, textvariable=self.search_var).pack(side=tk.LEFT, padx=5)
 
         ttk.Button(filter_frame, text="Apply", command=self.refresh_transactions).pack(side=tk.LEFT, padx=5)
@@ -354,13 +508,12 @@ class FinanceApp:
 
     # --- Event handlers / actions ---
     def refresh_categories(self):
-        cats = get_categories()
-        vals = cats.copy()
+        vals = get_categories()
         self.cat_cb.config(values=vals)
         # filter combobox
         self.filter_cat_cb.config(values=["All"] + vals)
         # if current selection not in list, set to first cat
-        if not self.cat_var.get() and vals:
+        if not self._fields["category"] and vals:
             self.cat_var.set(vals[0])
 
     def refresh_goals(self):
@@ -370,36 +523,70 @@ class FinanceApp:
         # populate left goals listbox
         self.goals_box.delete(0, tk.END)
         for g in goals:
-            prog = f"{g['progress']:.2f}/{g['target']:.2f}"
+            prog = f"{format_cents(g['progress_cents'])}/{g['target']:.2f}"
             dl = g["deadline"] if g["deadline"] else "-"
             self.goals_box.insert(tk.END, f"{g['name']}  ({prog})  deadline: {dl}")
 
     def refresh_transactions(self):
-        from_date = self.filter_from.get().strip() or None
-        to_date = self.filter_to.get().strip() or None
-        cat = self.filter_cat.get() or None
-        search = self.search_var.get().strip() or None
+        f = self._fields
+        from_date = f["filter_from"] or None
+        to_date = f["filter_to"] or None
+        cat = f["filter_cat"] or None
+        search = f["search"] or None
         try:
-            rows = fetch_transactions(date_from=from_date, date_to=to_date, category=cat, search=search, limit=2000)
+            items = [
+                (tx_id, (d, ttype, category, format_cents(cents), goal_name or "", notes or ""))
+                for tx_id, d, ttype, category, _amt, cents, notes, goal_name in fetch_transactions(date_from=from_date, date_to=to_date, category=cat, search=search, limit=2000)
+            ]
         except Exception as e:
             messagebox.showerror("Error", f"Failed to fetch transactions: {e}")
             return
-        # clear tree
-        for r in self.tree.get_children():
-            self.tree.delete(r)
-        # insert rows
-        for row in rows:
-            goal_name = row["goal_name"] if row["goal_name"] else ""
-            self.tree.insert("", tk.END, iid=row["id"], values=(row["date"], row["type"], row["category"], f"{Decimal(row['amount']):.2f}", goal_name, row["notes"] or ""))
+        # clear tree in a single Tcl call
+        self.tree.delete(*self.tree.get_children())
+        self._shown_ids = {iid for iid, _ in items}
+        self._tree_filter = (from_date, to_date, cat, search)
+        # insert the first screenful now, the rest when Tk is idle
+        self._tree_gen += 1
+        self._insert_tree_rows(items, 0, self._tree_gen)
         self.update_month_summary()
 
+    def _insert_tree_rows(self, items, start, gen):
+        if gen != self._tree_gen:
+            return
+        end = start + TREE_BATCH
+        for iid, values in items[start:end]:
+            self.tree.insert("", tk.END, iid=iid, values=values)
+        if end < len(items):
+            self.root.after_idle(self._insert_tree_rows, items, end, gen)
+
+    def _matches_tree_filter(self, d, cat, notes):
+        # mirrors the WHERE clause built by fetch_transactions (literal, ASCII-case-insensitive search)
+        from_date, to_date, filter_cat, search = self._tree_filter
+        if from_date and d < from_date:
+            return False
+        if to_date and d > to_date:
+            return False
+        if filter_cat and filter_cat != "All" and cat != filter_cat:
+            return False
+        if search:
+            s = search.translate(ASCII_LOWER)
+            if s not in (notes or "").translate(ASCII_LOWER) and s not in cat.translate(ASCII_LOWER):
+                return False
+        return True
+
+    def _sorts_first_in_tree(self, d):
+        # a newly added row has the largest id, so it goes on top unless its date is older
+        children = self.tree.get_children()
+        return not children or d >= self.tree.set(children[0], "date")
+
     def on_add_transaction(self):
-        d = self.date_var.get().strip()
-        t = self.type_var.get().strip()
-        cat = self.cat_var.get().strip()
-        amt = self.amt_var.get().strip()
-        notes = self.notes_var.get().strip()
-        goal_name = self.goal_var.get().strip()
+        f = self._fields
+        d = f["date"]
+        t = f["type"]
+        cat = f["category"]
+        amt = f["amount"]
+        notes = f["notes"]
+        goal_name = f["goal"]
 
         # validation
         try:
@@ -410,29 +597,30 @@ class FinanceApp:
             return
         try:
             dec = Decimal(amt)
-            if dec <= 0:
+            if not is_valid_amount(dec):
                 raise InvalidOperation
         except Exception:
-            messagebox.showerror("Validation", "Amount must be a positive number (e.g. 12.50).")
+            messagebox.showerror("Validation", "Amount must be a positive number with at most two decimals (e.g. 12.50).")
             return
-        # goal lookup
-        goal_id = None
-        if goal_name:
-            conn = get_connection()
-            r = conn.execute("SELECT id FROM goals WHERE name = ?", (goal_name,)).fetchone()
-            conn.close()
-            if r:
-                goal_id = r["id"]
-
         try:
-            add_transaction(d, t, cat, dec, notes, goal_id)
+            tx_id = add_transaction(d, t, cat, dec, notes, goal_name or None)
             messagebox.showinfo("Saved", "Transaction saved.")
             # clear inputs except date
             self.amt_var.set("")
             self.notes_var.set("")
             self.goal_var.set("")
-            self.refresh_transactions()
-            self.refresh_goals()
+            shown = self._matches_tree_filter(d, cat, notes)
+            if shown and not self._sorts_first_in_tree(d):
+                # let the query find its place; this also updates the month summary
+                self.refresh_transactions()
+            else:
+                if shown:
+                    self.tree.insert("", 0, iid=tx_id, values=(d, t, cat, format_cents(to_cents(dec)), goal_name, notes))
+                    self._shown_ids.add(tx_id)
+                if d[:7] == date.today().isoformat()[:7]:
+                    self.update_month_summary()
+            if goal_name:
+                self.refresh_goals()
         except Exception as e:
             messagebox.showerror("Error", f"Could not save transaction: {e}")
 
@@ -444,10 +632,15 @@ class FinanceApp:
         tx_id = int(sel[0])
         if not messagebox.askyesno("Confirm", "Delete the selected transaction?"):
             return
+        tx_date, tx_goal = self.tree.set(sel[0], "date"), self.tree.set(sel[0], "goal")
         try:
             delete_transaction(tx_id)
-            self.refresh_transactions()
-            self.refresh_goals()
+            self.tree.delete(sel[0])
+            self._shown_ids.discard(tx_id)
+            if tx_date[:7] == date.today().isoformat()[:7]:
+                self.update_month_summary()
+            if tx_goal:
+                self.refresh_goals()
         except Exception as e:
             messagebox.showerror("Error", f"Could not delete: {e}")
 
@@ -464,18 +657,49 @@ class FinanceApp:
                 messagebox.showerror("Error", f"Could not add goal: {e}")
 
     def on_export_csv(self):
-        rows = fetch_transactions(date_from=self.filter_from.get().strip() or None, date_to=self.filter_to.get().strip() or None, category=self.filter_cat.get() or None, search=self.search_var.get().strip() or None, limit=10000)
-        if not rows:
+        if self._export_thread is not None and self._export_thread.is_alive():
+            messagebox.showinfo("Export", "An export is already running.")
+            return
+        f = self._fields
+        filters = dict(date_from=f["filter_from"] or None, date_to=f["filter_to"] or None, category=f["filter_cat"] or None, search=f["search"] or None)
+        probe = fetch_transactions(**filters, limit=1)
+        first = next(probe, None)
+        probe.close()
+        if first is None:
             messagebox.showinfo("Export", "No transactions to export for the current filter.")
             return
         fname = filedialog.asksaveasfilename(defaultextension=".csv", filetypes=[("CSV files","*.csv")], initialfile=f"transactions_{datetime.now().strftime('%Y%m%d')}.csv")
         if not fname:
             return
+        # write the file off the Tk thread; the result comes back through the queue
+        results = queue.Queue()
+
+        def work():
+            # own connection: the Tk thread keeps using the shared one meanwhile
+            try:
+                conn = connect_readonly()
+                try:
+                    export_transactions_csv(fetch_transactions(**filters, limit=10000, conn=conn), fname)
+                finally:
+                    conn.close()
+                results.put(None)
+            except Exception as e:
+                results.put(e)
+
+        self._export_thread = threading.Thread(target=work, daemon=True)
+        self._export_thread.start()
+        self.root.after(100, self._poll_export, results, fname)
+
+    def _poll_export(self, results, fname):
         try:
-            export_transactions_csv(rows, fname)
+            err = results.get_nowait()
+        except queue.Empty:
+            self.root.after(100, self._poll_export, results, fname)
+            return
+        if err is None:
             messagebox.showinfo("Exported", f"Transactions exported to:\n{fname}")
-        except Exception as e:
-            messagebox.showerror("Error", f"Export failed: {e}")
+        else:
+            messagebox.showerror("Error", f"Export failed: {err}")
 
     def on_backup_db(self):
         try:
@@ -488,9 +712,9 @@ class FinanceApp:
         my = date.today().strftime("%Y-%m")
         income, expense = sum_month(my)
         bal = income - expense
-        self.income_var.set(f"{income:.2f}")
-        self.expense_var.set(f"{expense:.2f}")
-        self.balance_var.set(f"{bal:.2f}")
+        self.income_var.set(format_cents(income))
+        self.expense_var.set(format_cents(expense))
+        self.balance_var.set(format_cents(bal))
 
 
 class AddGoalDialog:
@@ -529,10 +753,10 @@ class AddGoalDialog:
             return
         try:
             dec = Decimal(target)
-            if dec <= 0:
+            if not is_valid_amount(dec):
                 raise InvalidOperation
         except Exception:
-            messagebox.showerror("Validation", "Target amount must be a positive number.")
+            messagebox.showerror("Validation", "Target amount must be a positive number with at most two decimals.")
             return
         if deadline:
             try: